@@ -1,5 +1,7 @@
 """UK Companies House API SDK."""
 
+from typing import Any
+
 from .auth import AuthHandler
 from .client import AsyncClient
 from .config import Config
@@ -15,8 +17,6 @@ from .exceptions import (
 from .models import (
     Address,
     BaseModel,
-    Charge,
-    ChargeList,
     Company,
     CompanySearchResult,
     OfficerSearchResult,
@@ -49,3 +49,12 @@ __all__ = [
     "ServerError",
     "NetworkError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported models (see ``ukcompanies.models``)."""
+    if name in ("Charge", "ChargeList"):
+        from . import models
+
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
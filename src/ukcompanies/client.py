@@ -1,7 +1,10 @@
 """Core async client for UK Companies API."""
 
+import asyncio
+import importlib.util
+import logging
 import re
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, Callable
 from datetime import datetime
 from typing import Any
 
@@ -9,13 +12,12 @@ import httpx
 import structlog
 
 from .auth import AuthHandler
+from .cache import TTLCache
 from .client_endpoints import EndpointMixin
 from .config import (
-    BASE_DELAY,
     DEFAULT_AUTO_RETRY,
     DEFAULT_BACKOFF_STRATEGY,
     JITTER_RANGE,
-    MAX_DELAY,
     Config,
 )
 from .exceptions import (
@@ -27,11 +29,15 @@ from .exceptions import (
     ServerError,
     ValidationError,
 )
+from .logging_utils import is_enabled_for
 from .models.rate_limit import RateLimitInfo
 from .retry import RetryConfig, RetryManager
 
 logger = structlog.get_logger(__name__)
 
+# HTTP/2 support needs the optional h2 package (pip install "ukcompanies[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class AsyncClient(EndpointMixin):
     """Async client for interacting with the Companies House API."""
@@ -57,7 +63,7 @@ class AsyncClient(EndpointMixin):
             config: Configuration object (uses env if not provided)
             auto_retry: Whether to automatically retry on rate limit
             max_retries: Maximum number of retry attempts
-            backoff: Backoff strategy ("exponential" or "fixed")
+            backoff: Backoff strategy ("decorrelated", "exponential" or "fixed")
             on_retry: Optional callback for retry events
             **kwargs: Additional config parameters
         """
@@ -78,8 +84,8 @@ class AsyncClient(EndpointMixin):
             auto_retry=auto_retry,
             max_retries=max_retries if max_retries is not None else self.config.max_retries,
             backoff=backoff,
-            base_delay=BASE_DELAY,
-            max_delay=MAX_DELAY,
+            base_delay=self.config.base_delay,
+            max_delay=self.config.max_backoff,
             jitter_range=JITTER_RANGE,
             on_retry=on_retry,
         )
@@ -92,10 +98,25 @@ class AsyncClient(EndpointMixin):
         if not self.auth.validate_api_key_format():
             logger.warning("API key format appears invalid")
 
+        # Resolved once so per-request debug logging is skipped when filtered out
+        self._debug_enabled = is_enabled_for(logger, logging.DEBUG)
+
+        # Shared gate that holds back requests while a rate limit window resets
+        self._rate_limit_ready = asyncio.Event()
+        self._rate_limit_ready.set()
+        self._rate_limit_resume: asyncio.TimerHandle | None = None
+
         # HTTP client will be initialized in __aenter__
         self._client: httpx.AsyncClient | None = None
         self._rate_limit_info: RateLimitInfo | None = None
 
+        # Cache of raw response bodies for company profile and address lookups
+        self._company_cache: TTLCache[bytes] = TTLCache(
+            maxsize=self.config.cache_size, ttl=self.config.cache_ttl
+        )
+        # Pending lookups by path, shared by concurrent callers of the same path
+        self._in_flight: dict[str, asyncio.Task[bytes]] = {}
+
         logger.info(
             "AsyncClient initialized",
             base_url=self.config.base_url,
@@ -105,17 +126,26 @@ class AsyncClient(EndpointMixin):
 
     async def __aenter__(self) -> "AsyncClient":
         """Enter async context manager."""
+        http2 = self.config.http2 and HTTP2_AVAILABLE
+
+        # One pooled client per session so requests reuse TCP/TLS connections;
+        # with HTTP/2 concurrent requests are multiplexed over one connection
         self._client = httpx.AsyncClient(
             base_url=self.config.base_url,
             timeout=self.config.timeout,
             headers=self.auth.get_headers(),
             follow_redirects=True,
+            limits=self.config.pool_limits,
+            http2=http2,
         )
-        logger.debug("HTTP client initialized")
+        logger.debug("HTTP client initialized", http2=http2)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Exit async context manager."""
+        if self._rate_limit_resume is not None:
+            self._rate_limit_resume.cancel()
+            self._resume_after_rate_limit()
         if self._client:
             await self._client.aclose()
             logger.debug("HTTP client closed")
@@ -129,6 +159,10 @@ class AsyncClient(EndpointMixin):
         """
         return self._rate_limit_info
 
+    def clear_cache(self) -> None:
+        """Discard all cached company lookups."""
+        self._company_cache.clear()
+
     def validate_company_number(self, company_number: str) -> str:
         """Validate and normalize a company number.
 
@@ -146,13 +180,14 @@ class AsyncClient(EndpointMixin):
 
         # Remove spaces and convert to uppercase
         normalized = company_number.strip().upper().replace(" ", "")
+        length = len(normalized)
 
-        # Check patterns
-        if self.COMPANY_NUMBER_PATTERN.match(normalized):
+        # Check patterns, skipping the regex for impossible lengths
+        if length == 8 and self.COMPANY_NUMBER_PATTERN.match(normalized):
             return normalized
 
-        # Try numeric pattern with padding
-        if self.COMPANY_NUMBER_NUMERIC.match(normalized):
+        # Try numeric pattern with padding (8-digit numbers matched above)
+        if length == 7 and self.COMPANY_NUMBER_NUMERIC.match(normalized):
             # Pad with leading zeros to 8 characters
             return normalized.zfill(8)
 
@@ -198,7 +233,7 @@ class AsyncClient(EndpointMixin):
                         limit=info.limit,
                         percent_remaining=info.percent_remaining,
                     )
-                else:
+                elif self._debug_enabled:
                     logger.debug(
                         "Rate limit status",
                         remaining=info.remain,
@@ -211,6 +246,32 @@ class AsyncClient(EndpointMixin):
 
         return None
 
+    def _pause_for_rate_limit(self, wait_time: float) -> None:
+        """Hold back new requests until the rate limit window resets.
+
+        All requests wait on one shared event released by a single timer, so
+        waiting tasks resume together instead of each sleeping on its own.
+
+        Args:
+            wait_time: Seconds until requests may resume
+        """
+        loop = asyncio.get_running_loop()
+        resume_at = loop.time() + wait_time
+
+        if self._rate_limit_resume is not None:
+            # Never shorten a pause that is already in progress
+            if self._rate_limit_resume.when() >= resume_at:
+                return
+            self._rate_limit_resume.cancel()
+
+        self._rate_limit_ready.clear()
+        self._rate_limit_resume = loop.call_at(resume_at, self._resume_after_rate_limit)
+
+    def _resume_after_rate_limit(self) -> None:
+        """Release requests held back by a rate limit pause."""
+        self._rate_limit_resume = None
+        self._rate_limit_ready.set()
+
     def _handle_error_response(self, response: httpx.Response) -> None:
         """Handle error responses from the API.
 
@@ -250,6 +311,7 @@ class AsyncClient(EndpointMixin):
         path: str,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
+        stream: bool = False,
         **kwargs: Any,
     ) -> httpx.Response:
         """Make an HTTP request to the API.
@@ -259,6 +321,7 @@ class AsyncClient(EndpointMixin):
             path: API endpoint path
             params: Query parameters
             json: JSON body data
+            stream: Return before reading the body; the caller must close the response
             **kwargs: Additional arguments for httpx
 
         Returns:
@@ -271,31 +334,47 @@ class AsyncClient(EndpointMixin):
         if not self._client:
             raise RuntimeError("Client not initialized. Use async with statement.")
 
+        # Wait out any rate limit pause triggered by another request
+        if not self._rate_limit_ready.is_set():
+            await self._rate_limit_ready.wait()
+
         # Log request
-        logger.debug(
-            "Making API request",
-            method=method,
-            path=path,
-            params=params,
-        )
+        if self._debug_enabled:
+            logger.debug(
+                "Making API request",
+                method=method,
+                path=path,
+                params=params,
+            )
 
         try:
-            response = await self._client.request(
-                method=method, url=path, params=params, json=json, **kwargs
-            )
+            if stream:
+                request = self._client.build_request(
+                    method=method, url=path, params=params, json=json, **kwargs
+                )
+                response = await self._client.send(request, stream=True)
+            else:
+                response = await self._client.request(
+                    method=method, url=path, params=params, json=json, **kwargs
+                )
 
             # Extract rate limit info from all responses
             self._extract_rate_limit_info(response)
 
             # Handle errors
             if response.status_code >= 400:
+                if stream:
+                    # Error bodies are small; read them so the message can be extracted
+                    await response.aread()
+                    await response.aclose()
                 self._handle_error_response(response)
 
-            logger.debug(
-                "Request successful",
-                status=response.status_code,
-                path=path,
-            )
+            if self._debug_enabled:
+                logger.debug(
+                    "Request successful",
+                    status=response.status_code,
+                    path=path,
+                )
 
             return response
 
@@ -305,6 +384,12 @@ class AsyncClient(EndpointMixin):
         except httpx.TimeoutException as e:
             logger.error("Request timeout", error=str(e), path=path)
             raise NetworkError(f"Request timeout: {str(e)}") from e
+        except RateLimitError as e:
+            # Pause all requests until the window resets when retries are enabled,
+            # capped like retry waits (Config.max_backoff)
+            if self.retry_config.auto_retry and e.retry_after:
+                self._pause_for_rate_limit(min(e.retry_after, self.retry_config.max_delay))
+            raise
         except CompaniesHouseError:
             # Re-raise our custom exceptions
             raise
@@ -342,6 +427,55 @@ class AsyncClient(EndpointMixin):
                 method, path, params=params, json=json, **kwargs
             )
 
+    async def _stream_items(
+        self, path: str, params: dict[str, Any] | None = None, prefix: str = "items.item"
+    ) -> AsyncGenerator[Any, None]:
+        """Make a streamed GET request and yield JSON array items as they arrive.
+
+        The body is parsed incrementally with ijson, so only the items of the
+        chunk currently being processed are held in memory.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            prefix: ijson prefix of the items to yield
+
+        Yields:
+            Decoded JSON items
+
+        Raises:
+            ImportError: If the optional ijson package is not installed
+        """
+        try:
+            import ijson
+        except ImportError as e:
+            raise ImportError(
+                "Streaming requires the optional ijson package: "
+                'pip install "ukcompanies[streaming]"'
+            ) from e
+
+        response = await self._request("GET", path, params=params, stream=True)
+        items = ijson.sendable_list()
+        parser = ijson.items_coro(items, prefix, use_float=True)
+
+        try:
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+
+            parser.close()
+            for item in items:
+                yield item
+        except httpx.TransportError as e:
+            logger.error("Network error", error=str(e), path=path)
+            raise NetworkError(f"Network error: {str(e)}") from e
+        except ijson.JSONError as e:
+            raise CompaniesHouseError(f"Invalid JSON response: {str(e)}") from e
+        finally:
+            await response.aclose()
+
     async def get(
         self, path: str, params: dict[str, Any] | None = None, **kwargs: Any
     ) -> dict[str, Any]:
@@ -358,6 +492,25 @@ class AsyncClient(EndpointMixin):
         response = await self._request("GET", path, params=params, **kwargs)
         return response.json()  # type: ignore[no-any-return]
 
+    async def _get_content(
+        self, path: str, params: dict[str, Any] | None = None, **kwargs: Any
+    ) -> bytes:
+        """Make a GET request and return the raw response body.
+
+        Endpoint methods pass the body straight to ``Model.model_validate_json``
+        so JSON decoding and validation happen in a single pass.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            **kwargs: Additional arguments
+
+        Returns:
+            Raw JSON response body
+        """
+        response = await self._request("GET", path, params=params, **kwargs)
+        return response.content
+
     async def post(
         self, path: str, json: dict[str, Any] | None = None, **kwargs: Any
     ) -> dict[str, Any]:
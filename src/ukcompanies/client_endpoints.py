@@ -1,29 +1,48 @@
 """Endpoint methods for AsyncClient - search and company operations."""
 
 import asyncio
-import random
+from collections import deque
 from collections.abc import AsyncGenerator, Callable
-from typing import TYPE_CHECKING, Any
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import structlog
+from pydantic import BaseModel, TypeAdapter
 
 if TYPE_CHECKING:
     import httpx
 
+    from .cache import TTLCache
     from .config import Config
 
+    # Models for less frequently used endpoints are imported inside the
+    # methods that need them to keep ``import ukcompanies`` fast
+    from .models.appointment import AppointmentList
+    from .models.charge import Charge, ChargeList
+    from .models.disqualification import DisqualificationList
+    from .models.document import Document, DocumentContent, DocumentFormat
+    from .models.filing import FilingCategory, FilingHistoryList, FilingTransaction
+    from .models.officer import OfficerList
+
 from .exceptions import RateLimitError, ServerError, ValidationError
 from .models import Address, Company
-from .models.appointment import AppointmentList
-from .models.charge import Charge, ChargeList
-from .models.disqualification import DisqualificationList
-from .models.document import Document, DocumentContent, DocumentFormat, DocumentMetadata
-from .models.filing import FilingCategory, FilingHistoryList, FilingTransaction
-from .models.officer import OfficerList
-from .models.search import AllSearchResult, CompanySearchResult, OfficerSearchResult
+from .models.search import (
+    AllSearchResult,
+    CompanySearchResult,
+    OfficerSearchResult,
+    SearchItem,
+    SearchResult,
+)
+from .retry import decorrelated_backoff
 
 logger = structlog.get_logger(__name__)
 
+SearchResultT = TypeVar("SearchResultT", bound=SearchResult)
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Validates individual items of a combined search, dispatching on their kind
+_SEARCH_ITEM_ADAPTER: TypeAdapter[SearchItem] = TypeAdapter(SearchItem)
+
 
 class EndpointMixin:
     """Mixin class providing endpoint methods for AsyncClient."""
@@ -32,12 +51,16 @@ class EndpointMixin:
         # Attributes and methods supplied by the concrete AsyncClient this
         # mixin is combined into. Declared for the type checker only; they do
         # not exist at runtime on the mixin itself.
-        async def get(
+        config: "Config"
+        _company_cache: "TTLCache[bytes]"
+        _in_flight: dict[str, "asyncio.Task[bytes]"]
+
+        async def _get_content(
             self,
             path: str,
             params: dict[str, Any] | None = ...,
             **kwargs: Any,
-        ) -> dict[str, Any]: ...
+        ) -> bytes: ...
 
         async def _request(
             self,
@@ -48,8 +71,57 @@ class EndpointMixin:
             **kwargs: Any,
         ) -> "httpx.Response": ...
 
+        def _stream_items(
+            self,
+            path: str,
+            params: dict[str, Any] | None = ...,
+            prefix: str = ...,
+        ) -> AsyncGenerator[Any, None]: ...
+
         def validate_company_number(self, company_number: str) -> str: ...
 
+    async def _search(
+        self,
+        path: str,
+        query: str,
+        items_per_page: int,
+        start_index: int,
+        model: type[SearchResultT],
+    ) -> SearchResultT:
+        """Run a search request and parse the response.
+
+        Args:
+            path: Search endpoint path
+            query: Search query string
+            items_per_page: Number of results per page (max 100)
+            start_index: Starting index for pagination
+            model: Search result model to parse the response into
+
+        Returns:
+            Parsed search result
+        """
+        params = self._search_params(query, items_per_page, start_index)
+        body = await self._get_content(path, params=params)
+        return model.model_validate_json(body)
+
+    @staticmethod
+    def _search_params(query: str, items_per_page: int, start_index: int) -> dict[str, Any]:
+        """Build query parameters for a search request.
+
+        Args:
+            query: Search query string
+            items_per_page: Number of results per page (max 100)
+            start_index: Starting index for pagination
+
+        Returns:
+            Query parameters dictionary
+        """
+        return {
+            "q": query,
+            "items_per_page": min(items_per_page, 100),
+            "start_index": start_index,
+        }
+
     async def search_companies(
         self,
         query: str,
@@ -66,14 +138,9 @@ class EndpointMixin:
         Returns:
             CompanySearchResult with matching companies
         """
-        params = {
-            "q": query,
-            "items_per_page": min(items_per_page, 100),
-            "start_index": start_index,
-        }
-
-        response = await self.get("/search/companies", params=params)
-        return CompanySearchResult(**response)
+        return await self._search(
+            "/search/companies", query, items_per_page, start_index, CompanySearchResult
+        )
 
     async def search_officers(
         self,
@@ -91,14 +158,9 @@ class EndpointMixin:
         Returns:
             OfficerSearchResult with matching officers
         """
-        params = {
-            "q": query,
-            "items_per_page": min(items_per_page, 100),
-            "start_index": start_index,
-        }
-
-        response = await self.get("/search/officers", params=params)
-        return OfficerSearchResult(**response)
+        return await self._search(
+            "/search/officers", query, items_per_page, start_index, OfficerSearchResult
+        )
 
     async def search_all(
         self,
@@ -116,14 +178,9 @@ class EndpointMixin:
         Returns:
             AllSearchResult with all matching items
         """
-        params = {
-            "q": query,
-            "items_per_page": min(items_per_page, 100),
-            "start_index": start_index,
-        }
-
-        response = await self.get("/search", params=params)
-        return AllSearchResult(**response)
+        return await self._search(
+            "/search", query, items_per_page, start_index, AllSearchResult
+        )
 
     async def search_all_pages(
         self,
@@ -133,6 +190,13 @@ class EndpointMixin:
     ) -> AsyncGenerator[AllSearchResult, None]:
         """Search all resources and yield results page by page.
 
+        The first page is fetched on its own to learn the total number of
+        results. The remaining pages are prefetched concurrently, at most
+        ``config.max_concurrency`` ahead of the page being yielded, and are
+        yielded in order. A new request is only started as each page is
+        yielded, so a caller that stops reading stops triggering requests.
+        ``config.pagination_delay`` spaces out the start of each request.
+
         Args:
             query: Search query string
             per_page: Number of results per page (max 100)
@@ -141,34 +205,149 @@ class EndpointMixin:
         Yields:
             AllSearchResult for each page of results
         """
-        start_index = 0
-        page_count = 0
         items_per_page = min(per_page, 100)
 
+        # Fetch the first page to discover the total number of results
+        first = await self.search_all(query, items_per_page, 0)
+        yield first
+
+        if max_pages == 1 or not first.has_more_pages:
+            return
+
+        # Work out the start index of every remaining page
+        step = first.items_per_page or items_per_page
+        start_indexes = range(first.next_start_index, first.total_results, step)
+        if max_pages:
+            start_indexes = start_indexes[: max_pages - 1]
+
+        remaining = iter(start_indexes)
+        pending: deque[asyncio.Task[AllSearchResult]] = deque()
+
+        async def schedule_next() -> None:
+            start_index = next(remaining, None)
+            if start_index is None:
+                return
+            # Optional delay between requests; 429s are handled by retry logic
+            if self.config.pagination_delay:
+                await asyncio.sleep(self.config.pagination_delay)
+            pending.append(
+                asyncio.create_task(self.search_all(query, items_per_page, start_index))
+            )
+
+        try:
+            for _ in range(self.config.max_concurrency):
+                await schedule_next()
+
+            while pending:
+                page = await pending.popleft()
+                # Keep the window full while the caller handles this page
+                await schedule_next()
+                yield page
+        finally:
+            # Stop any outstanding requests if the caller stops early or a page fails
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def search_all_items(
+        self,
+        query: str,
+        per_page: int = 100,
+        max_items: int | None = None,
+    ) -> AsyncGenerator[SearchItem, None]:
+        """Search all resources and yield matching items one at a time.
+
+        Each page is streamed and parsed incrementally instead of being
+        buffered and decoded whole, so memory use stays bounded regardless of
+        page size. Requires the optional ijson package
+        (``pip install "ukcompanies[streaming]"``).
+
+        Args:
+            query: Search query string
+            per_page: Number of results per page (max 100)
+            max_items: Maximum number of items to yield (None for all)
+
+        Yields:
+            CompanySearchItem, OfficerSearchItem or DisqualifiedOfficerSearchItem
+        """
+        items_per_page = min(per_page, 100)
+        start_index = 0
+        item_count = 0
+
         while True:
-            # Check if we've reached the max pages limit
-            if max_pages and page_count >= max_pages:
-                break
+            params = self._search_params(query, items_per_page, start_index)
+            page_count = 0
 
-            # Fetch the current page
-            result = await self.search_all(query, items_per_page, start_index)
-            yield result
+            async with aclosing(self._stream_items("/search", params)) as items:
+                async for item in items:
+                    yield _SEARCH_ITEM_ADAPTER.validate_python(item)
+                    page_count += 1
+                    item_count += 1
 
-            page_count += 1
+                    if max_items and item_count >= max_items:
+                        return
 
-            # Check if there are more pages
-            if not result.has_more_pages:
+            # A short page means there are no more results
+            if page_count < items_per_page:
                 break
 
-            # Update start index for next page
-            start_index = result.next_start_index
+            start_index += page_count
+
+            # Optional delay between pages; 429s are handled by retry logic
+            if self.config.pagination_delay:
+                await asyncio.sleep(self.config.pagination_delay)
+
+    async def _get_cached(self, path: str, model: type[ModelT]) -> ModelT:
+        """Fetch and parse a cacheable resource, coalescing concurrent lookups.
+
+        Concurrent lookups of the same path share one request, run in a
+        detached task so that cancelling one caller does not cancel the
+        others. The shared task returns the raw body, which each caller parses
+        into its own model instance, so callers cannot change what later
+        lookups see. Bodies are cached only once they have validated.
+
+        Args:
+            path: API endpoint path, also used as the cache key
+            model: Model class to parse the response into
+
+        Returns:
+            Parsed model instance
+        """
+        # Raw bodies are cached so every hit parses a fresh, independent model
+        cached = self._company_cache.get(path)
+        if cached is not None:
+            return model.model_validate_json(cached)
+
+        task = self._in_flight.get(path)
+        if task is None:
+            task = asyncio.create_task(self._get_content(path))
+            self._in_flight[path] = task
+            task.add_done_callback(lambda done: self._finish_in_flight(path, done))
+
+        body: bytes = await asyncio.shield(task)
+        value = model.model_validate_json(body)
+        self._company_cache.set(path, body)
+        return value
+
+    def _finish_in_flight(self, path: str, task: "asyncio.Task[bytes]") -> None:
+        """Forget a settled lookup so the next caller starts a new request.
 
-            # Small delay between pages to be respectful
-            await asyncio.sleep(0.1)
+        Args:
+            path: API endpoint path the lookup was registered under
+            task: The settled lookup task
+        """
+        if self._in_flight.get(path) is task:
+            del self._in_flight[path]
+        # Mark failures as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
 
     async def get_company(self, company_number: str) -> Company:
         """Get company profile information.
 
+        Results are cached per company number for ``config.cache_ttl`` seconds,
+        and concurrent lookups of the same company share a single request.
+
         Args:
             company_number: Company registration number
 
@@ -181,13 +360,16 @@ class EndpointMixin:
         """
         # Validate and normalize company number
         normalized = self.validate_company_number(company_number)
+        path = f"/company/{normalized}"
 
-        response = await self.get(f"/company/{normalized}")
-        return Company(**response)
+        return await self._get_cached(path, Company)
 
     async def get_company_address(self, company_number: str) -> Address:
         """Get company registered office address.
 
+        Results are cached per company number for ``config.cache_ttl`` seconds,
+        and concurrent lookups of the same company share a single request.
+
         Args:
             company_number: Company registration number
 
@@ -200,9 +382,9 @@ class EndpointMixin:
         """
         # Validate and normalize company number
         normalized = self.validate_company_number(company_number)
+        path = f"/company/{normalized}/registered-office-address"
 
-        response = await self.get(f"/company/{normalized}/registered-office-address")
-        return Address(**response)
+        return await self._get_cached(path, Address)
 
     async def get_officers(
         self,
@@ -211,7 +393,7 @@ class EndpointMixin:
         start_index: int = 0,
         register_type: str | None = None,
         order_by: str | None = None,
-    ) -> OfficerList:
+    ) -> "OfficerList":
         """Get list of officers for a company.
 
         Args:
@@ -228,6 +410,8 @@ class EndpointMixin:
             ValidationError: If company number is invalid
             NotFoundError: If company doesn't exist
         """
+        from .models.officer import OfficerList
+
         # Validate and normalize company number
         normalized = self.validate_company_number(company_number)
 
@@ -241,15 +425,15 @@ class EndpointMixin:
         if order_by:
             params["order_by"] = order_by
 
-        response = await self.get(f"/company/{normalized}/officers", params=params)
-        return OfficerList(**response)
+        body = await self._get_content(f"/company/{normalized}/officers", params=params)
+        return OfficerList.model_validate_json(body)
 
     async def get_appointments(
         self,
         officer_id: str,
         items_per_page: int = 50,
         start_index: int = 0,
-    ) -> AppointmentList:
+    ) -> "AppointmentList":
         """Get all appointments for a specific officer.
 
         Args:
@@ -264,6 +448,8 @@ class EndpointMixin:
             ValidationError: If officer ID is invalid
             NotFoundError: If officer doesn't exist
         """
+        from .models.appointment import AppointmentList
+
         # Validate officer ID
         if not officer_id or not officer_id.strip():
             raise ValidationError("Officer ID cannot be empty")
@@ -276,12 +462,12 @@ class EndpointMixin:
             "start_index": start_index,
         }
 
-        response = await self.get(f"/officers/{clean_id}/appointments", params=params)
-        return AppointmentList(**response)
+        body = await self._get_content(f"/officers/{clean_id}/appointments", params=params)
+        return AppointmentList.model_validate_json(body)
 
     async def get_disqualified_natural(
         self, officer_id: str
-    ) -> DisqualificationList:
+    ) -> "DisqualificationList":
         """Get disqualification details for a natural person.
 
         Args:
@@ -294,6 +480,8 @@ class EndpointMixin:
             ValidationError: If officer ID is invalid
             NotFoundError: If officer doesn't exist or has no disqualifications
         """
+        from .models.disqualification import DisqualificationList
+
         # Validate officer ID
         if not officer_id or not officer_id.strip():
             raise ValidationError("Officer ID cannot be empty")
@@ -301,12 +489,12 @@ class EndpointMixin:
         # Clean the officer ID
         clean_id = officer_id.strip()
 
-        response = await self.get(f"/disqualified-officers/natural/{clean_id}")
-        return DisqualificationList(**response)
+        body = await self._get_content(f"/disqualified-officers/natural/{clean_id}")
+        return DisqualificationList.model_validate_json(body)
 
     async def get_disqualified_corporate(
         self, officer_id: str
-    ) -> DisqualificationList:
+    ) -> "DisqualificationList":
         """Get disqualification details for a corporate officer.
 
         Args:
@@ -319,6 +507,8 @@ class EndpointMixin:
             ValidationError: If officer ID is invalid
             NotFoundError: If officer doesn't exist or has no disqualifications
         """
+        from .models.disqualification import DisqualificationList
+
         # Validate officer ID
         if not officer_id or not officer_id.strip():
             raise ValidationError("Officer ID cannot be empty")
@@ -326,15 +516,15 @@ class EndpointMixin:
         # Clean the officer ID
         clean_id = officer_id.strip()
 
-        response = await self.get(f"/disqualified-officers/corporate/{clean_id}")
-        return DisqualificationList(**response)
+        body = await self._get_content(f"/disqualified-officers/corporate/{clean_id}")
+        return DisqualificationList.model_validate_json(body)
 
     async def get_appointments_pages(
         self,
         officer_id: str,
         per_page: int = 50,
         max_pages: int | None = None,
-    ) -> AsyncGenerator[AppointmentList, None]:
+    ) -> AsyncGenerator["AppointmentList", None]:
         """Get all appointments for an officer, yielding page by page.
 
         Args:
@@ -367,8 +557,9 @@ class EndpointMixin:
             # Update start index for next page
             start_index = result.next_start_index
 
-            # Small delay between pages to be respectful
-            await asyncio.sleep(0.1)
+            # Optional delay between pages; 429s are handled by retry logic
+            if self.config.pagination_delay:
+                await asyncio.sleep(self.config.pagination_delay)
 
     # Convenience aliases
     async def profile(self, company_number: str) -> Company:
@@ -379,15 +570,17 @@ class EndpointMixin:
         """Alias for get_company_address."""
         return await self.get_company_address(company_number)
 
-    async def officers(self, company_number: str, **kwargs: Any) -> OfficerList:
+    async def officers(self, company_number: str, **kwargs: Any) -> "OfficerList":
         """Alias for get_officers."""
         return await self.get_officers(company_number, **kwargs)
 
-    async def appointments(self, officer_id: str, **kwargs: Any) -> AppointmentList:
+    async def appointments(self, officer_id: str, **kwargs: Any) -> "AppointmentList":
         """Alias for get_appointments."""
         return await self.get_appointments(officer_id, **kwargs)
 
-    async def disqualified(self, officer_id: str, corporate: bool = False) -> DisqualificationList:
+    async def disqualified(
+        self, officer_id: str, corporate: bool = False
+    ) -> "DisqualificationList":
         """Get disqualification details for an officer.
 
         Args:
@@ -405,10 +598,10 @@ class EndpointMixin:
     async def filing_history(
         self,
         company_number: str,
-        category: FilingCategory | str | None = None,
+        category: "FilingCategory | str | None" = None,
         items_per_page: int = 25,
         start_index: int = 0,
-    ) -> FilingHistoryList:
+    ) -> "FilingHistoryList":
         """Get filing history for a company.
 
         Args:
@@ -424,6 +617,8 @@ class EndpointMixin:
             ValidationError: If company number is invalid
             NotFoundError: If company doesn't exist
         """
+        from .models.filing import FilingCategory, FilingHistoryList
+
         # Validate and normalize company number
         normalized = self.validate_company_number(company_number)
 
@@ -440,14 +635,14 @@ class EndpointMixin:
             else:
                 params["category"] = category
 
-        response = await self.get(f"/company/{normalized}/filing-history", params=params)
-        return FilingHistoryList(**response)
+        body = await self._get_content(f"/company/{normalized}/filing-history", params=params)
+        return FilingHistoryList.model_validate_json(body)
 
     async def filing_transaction(
         self,
         company_number: str,
         transaction_id: str,
-    ) -> FilingTransaction:
+    ) -> "FilingTransaction":
         """Get details of a specific filing transaction.
 
         Args:
@@ -461,6 +656,8 @@ class EndpointMixin:
             ValidationError: If company number or transaction ID is invalid
             NotFoundError: If company or transaction doesn't exist
         """
+        from .models.filing import FilingTransaction
+
         # Validate and normalize company number
         normalized = self.validate_company_number(company_number)
 
@@ -470,15 +667,15 @@ class EndpointMixin:
 
         clean_id = transaction_id.strip()
 
-        response = await self.get(f"/company/{normalized}/filing-history/{clean_id}")
-        return FilingTransaction(**response)
+        body = await self._get_content(f"/company/{normalized}/filing-history/{clean_id}")
+        return FilingTransaction.model_validate_json(body)
 
     async def list_charges(
         self,
         company_number: str,
         items_per_page: int = 25,
         start_index: int = 0,
-    ) -> ChargeList:
+    ) -> "ChargeList":
         """List the charges (mortgages) registered against a company.
 
         Args:
@@ -493,6 +690,8 @@ class EndpointMixin:
             ValidationError: If company number is invalid
             NotFoundError: If company doesn't exist
         """
+        from .models.charge import ChargeList
+
         # Validate and normalize company number
         normalized = self.validate_company_number(company_number)
 
@@ -501,14 +700,14 @@ class EndpointMixin:
             "start_index": start_index,
         }
 
-        response = await self.get(f"/company/{normalized}/charges", params=params)
-        return ChargeList(**response)
+        body = await self._get_content(f"/company/{normalized}/charges", params=params)
+        return ChargeList.model_validate_json(body)
 
     async def get_charge(
         self,
         company_number: str,
         charge_id: str,
-    ) -> Charge:
+    ) -> "Charge":
         """Get details of a single charge registered against a company.
 
         Args:
@@ -522,6 +721,8 @@ class EndpointMixin:
             ValidationError: If company number or charge ID is invalid
             NotFoundError: If company or charge doesn't exist
         """
+        from .models.charge import Charge
+
         # Validate and normalize company number
         normalized = self.validate_company_number(company_number)
 
@@ -531,10 +732,10 @@ class EndpointMixin:
 
         clean_id = charge_id.strip()
 
-        response = await self.get(f"/company/{normalized}/charges/{clean_id}")
-        return Charge(**response)
+        body = await self._get_content(f"/company/{normalized}/charges/{clean_id}")
+        return Charge.model_validate_json(body)
 
-    async def document(self, document_id: str) -> Document:
+    async def document(self, document_id: str) -> "Document":
         """Get document metadata.
 
         Args:
@@ -547,16 +748,18 @@ class EndpointMixin:
             ValidationError: If document ID is invalid
             NotFoundError: If document doesn't exist
         """
+        from .models.document import Document, DocumentMetadata
+
         # Validate document ID
         if not document_id or not document_id.strip():
             raise ValidationError("Document ID cannot be empty")
 
         clean_id = document_id.strip()
 
-        response = await self.get(f"/document/{clean_id}")
+        body = await self._get_content(f"/document/{clean_id}")
 
         # Parse response to DocumentMetadata first
-        metadata = DocumentMetadata(**response)
+        metadata = DocumentMetadata.model_validate_json(body)
 
         # Convert to Document model
         return Document.from_metadata(clean_id, metadata)
@@ -564,8 +767,8 @@ class EndpointMixin:
     async def document_content(
         self,
         document_id: str,
-        format: DocumentFormat | str | None = None,
-    ) -> DocumentContent:
+        format: "DocumentFormat | str | None" = None,
+    ) -> "DocumentContent":
         """Get document content in specified format.
 
         Args:
@@ -579,6 +782,8 @@ class EndpointMixin:
             ValidationError: If document ID is invalid
             NotFoundError: If document doesn't exist
         """
+        from .models.document import DocumentContent, DocumentFormat
+
         # Validate document ID
         if not document_id or not document_id.strip():
             raise ValidationError("Document ID cannot be empty")
@@ -659,10 +864,10 @@ class EndpointMixin:
     async def filing_history_pages(
         self,
         company_number: str,
-        category: FilingCategory | str | None = None,
+        category: "FilingCategory | str | None" = None,
         per_page: int = 25,
         max_pages: int | None = None,
-    ) -> AsyncGenerator[FilingHistoryList, None]:
+    ) -> AsyncGenerator["FilingHistoryList", None]:
         """Get filing history for a company, yielding page by page.
 
         Args:
@@ -701,8 +906,9 @@ class EndpointMixin:
             # Update start index for next page
             start_index = fetched_items
 
-            # Small delay between pages to be respectful
-            await asyncio.sleep(0.1)
+            # Optional delay between pages; 429s are handled by retry logic
+            if self.config.pagination_delay:
+                await asyncio.sleep(self.config.pagination_delay)
 
 
 class RetryMixin:
@@ -723,116 +929,87 @@ class RetryMixin:
             **kwargs: Any,
         ) -> "httpx.Response": ...
 
+    def _compute_backoff(self, prev_sleep: float, exc: RateLimitError | ServerError) -> float:
+        """Calculate how long to wait before the next retry.
+
+        Uses decorrelated jitter (see ``retry.decorrelated_backoff``).
+
+        Args:
+            prev_sleep: Previous wait in seconds (``config.base_delay`` initially)
+            exc: Exception raised by the failed request
+
+        Returns:
+            Delay in seconds before next retry
+        """
+        if isinstance(exc, RateLimitError) and exc.retry_after:
+            # Use the server-provided retry time
+            wait_time = exc.retry_after
+        else:
+            wait_time = decorrelated_backoff(prev_sleep, self.config.base_delay)
+
+        # Rate limit and server errors share the same cap
+        return min(wait_time, self.config.max_backoff)
+
     async def _request_with_retry(
         self,
         method: str,
         path: str,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
-        retry_count: int = 0,
         on_retry: Callable[[int, Exception], None] | None = None,
         **kwargs: Any,
     ) -> Any:
         """Make an HTTP request with retry logic.
 
+        Rate limit (429) and server (5xx) errors are retried with backoff
+        until ``config.max_retries`` is reached.
+
         Args:
             method: HTTP method
             path: API endpoint path
             params: Query parameters
             json: JSON body data
-            retry_count: Current retry attempt (for recursion)
             on_retry: Optional callback for retry events
             **kwargs: Additional arguments
 
         Returns:
             HTTP response object
         """
-        try:
-            # Call the original _request method
-            return await self._request_without_retry(
-                method, path, params=params, json=json, **kwargs
-            )
-        except RateLimitError as e:
-            # Check if we should retry
-            if retry_count >= self.config.max_retries:
-                logger.warning(
-                    "Max retries exceeded",
-                    retry_count=retry_count,
-                    max_retries=self.config.max_retries,
-                )
-                raise
-
-            # Calculate backoff time
-            if e.retry_after:
-                # Use the server-provided retry time
-                wait_time = e.retry_after
-            else:
-                # Exponential backoff with jitter
-                base_wait = 2**retry_count
-                jitter = random.uniform(0, 1)
-                wait_time = base_wait + jitter
-
-            logger.info(
-                "Rate limited, retrying",
-                retry_count=retry_count + 1,
-                wait_time=wait_time,
-                retry_after=e.retry_after,
-            )
+        attempt = 0
+        prev_sleep = self.config.base_delay
 
-            # Call retry callback if provided
-            if on_retry:
-                on_retry(retry_count + 1, e)
-
-            # Wait before retrying
-            await asyncio.sleep(wait_time)
-
-            # Retry the request
-            return await self._request_with_retry(
-                method,
-                path,
-                params=params,
-                json=json,
-                retry_count=retry_count + 1,
-                on_retry=on_retry,
-                **kwargs,
-            )
-        except ServerError as e:
-            # Retry on server errors (5xx) with exponential backoff
-            if retry_count >= self.config.max_retries:
-                logger.warning(
-                    "Max retries exceeded for server error",
-                    retry_count=retry_count,
-                    max_retries=self.config.max_retries,
+        while True:
+            try:
+                return await self._request_without_retry(
+                    method, path, params=params, json=json, **kwargs
+                )
+            except (RateLimitError, ServerError) as e:
+                # Check if we should retry
+                if attempt >= self.config.max_retries:
+                    logger.warning(
+                        "Max retries exceeded",
+                        retry_count=attempt,
+                        max_retries=self.config.max_retries,
+                        status_code=e.status_code,
+                    )
+                    raise
+
+                wait_time = self._compute_backoff(prev_sleep, e)
+                prev_sleep = wait_time
+                attempt += 1
+
+                logger.info(
+                    "Rate limited, retrying"
+                    if isinstance(e, RateLimitError)
+                    else "Server error, retrying",
+                    retry_count=attempt,
+                    wait_time=wait_time,
                     status_code=e.status_code,
                 )
-                raise
-
-            # Exponential backoff with jitter for server errors
-            base_wait = 2**retry_count
-            jitter = random.uniform(0, 1)
-            wait_time = min(base_wait + jitter, 30)  # Cap at 30 seconds
-
-            logger.info(
-                "Server error, retrying",
-                retry_count=retry_count + 1,
-                wait_time=wait_time,
-                status_code=e.status_code,
-            )
 
-            # Call retry callback if provided
-            if on_retry:
-                on_retry(retry_count + 1, e)
-
-            # Wait before retrying
-            await asyncio.sleep(wait_time)
-
-            # Retry the request
-            return await self._request_with_retry(
-                method,
-                path,
-                params=params,
-                json=json,
-                retry_count=retry_count + 1,
-                on_retry=on_retry,
-                **kwargs,
-            )
+                # Call retry callback if provided
+                if on_retry:
+                    on_retry(attempt, e)
+
+                # Wait before retrying
+                await asyncio.sleep(wait_time)
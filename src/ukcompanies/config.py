@@ -7,6 +7,7 @@ import contextlib
 import os
 from typing import Any
 
+import httpx
 from pydantic import BaseModel, Field, field_validator
 
 # API Endpoints
@@ -16,12 +17,24 @@ SANDBOX_URL = "https://api-sandbox.company-information.service.gov.uk"
 # Default settings
 DEFAULT_TIMEOUT = 30.0  # seconds
 DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_BACKOFF = 30.0  # seconds
+DEFAULT_PAGINATION_DELAY = 0.0  # seconds
+DEFAULT_MAX_CONCURRENCY = 5  # concurrent page requests
+
+# Response cache defaults
+DEFAULT_CACHE_TTL = 300  # seconds
+DEFAULT_CACHE_SIZE = 1024  # entries
+
+# Connection pool defaults
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # seconds
 RATE_LIMIT_WINDOW = 300  # 5 minutes in seconds
 RATE_LIMIT_MAX_REQUESTS = 600  # Max requests per window
 
 # Retry configuration defaults
 DEFAULT_AUTO_RETRY = True
-DEFAULT_BACKOFF_STRATEGY = "exponential"
+DEFAULT_BACKOFF_STRATEGY = "decorrelated"
 BASE_DELAY = 1.0  # seconds
 MAX_DELAY = 60.0  # seconds
 JITTER_RANGE = 1.0  # seconds
@@ -35,6 +48,36 @@ class Config(BaseModel):
     timeout: float = Field(default=DEFAULT_TIMEOUT, description="Request timeout in seconds")
     max_retries: int = Field(default=DEFAULT_MAX_RETRIES, description="Maximum retry attempts")
     use_sandbox: bool = Field(default=False, description="Use sandbox environment")
+    base_delay: float = Field(
+        default=BASE_DELAY, description="Minimum wait between retries in seconds"
+    )
+    max_backoff: float = Field(
+        default=DEFAULT_MAX_BACKOFF, description="Maximum wait between retries in seconds"
+    )
+    pagination_delay: float = Field(
+        default=DEFAULT_PAGINATION_DELAY, description="Delay between page requests in seconds"
+    )
+    max_concurrency: int = Field(
+        default=DEFAULT_MAX_CONCURRENCY, description="Maximum concurrent page requests"
+    )
+    cache_ttl: int = Field(
+        default=DEFAULT_CACHE_TTL, description="Company lookup cache TTL in seconds (0 disables)"
+    )
+    cache_size: int = Field(
+        default=DEFAULT_CACHE_SIZE, description="Maximum cached company lookups (0 disables)"
+    )
+    http2: bool = Field(
+        default=True, description="Use HTTP/2 when the optional h2 package is installed"
+    )
+    max_connections: int = Field(
+        default=DEFAULT_MAX_CONNECTIONS, description="Maximum concurrent connections"
+    )
+    max_keepalive_connections: int = Field(
+        default=DEFAULT_MAX_KEEPALIVE_CONNECTIONS, description="Maximum idle pooled connections"
+    )
+    keepalive_expiry: float = Field(
+        default=DEFAULT_KEEPALIVE_EXPIRY, description="Idle connection lifetime in seconds"
+    )
 
     @field_validator("api_key")
     @classmethod
@@ -64,6 +107,54 @@ class Config(BaseModel):
             raise ValueError("Max retries cannot exceed 10")
         return v
 
+    @field_validator("base_delay")
+    @classmethod
+    def validate_base_delay(cls, v: float) -> float:
+        """Validate base delay."""
+        if v <= 0:
+            raise ValueError("Base delay must be positive")
+        return v
+
+    @field_validator("max_backoff")
+    @classmethod
+    def validate_max_backoff(cls, v: float) -> float:
+        """Validate max backoff."""
+        if v <= 0:
+            raise ValueError("Max backoff must be positive")
+        return v
+
+    @field_validator("pagination_delay")
+    @classmethod
+    def validate_pagination_delay(cls, v: float) -> float:
+        """Validate pagination delay."""
+        if v < 0:
+            raise ValueError("Pagination delay cannot be negative")
+        return v
+
+    @field_validator("max_concurrency")
+    @classmethod
+    def validate_max_concurrency(cls, v: int) -> int:
+        """Validate max concurrency."""
+        if v < 1:
+            raise ValueError("Max concurrency must be at least 1")
+        return v
+
+    @field_validator("cache_ttl", "cache_size")
+    @classmethod
+    def validate_cache_settings(cls, v: int) -> int:
+        """Validate cache settings."""
+        if v < 0:
+            raise ValueError("Cache settings cannot be negative")
+        return v
+
+    @field_validator("max_connections", "max_keepalive_connections", "keepalive_expiry")
+    @classmethod
+    def validate_pool_limits(cls, v: float) -> float:
+        """Validate connection pool limits."""
+        if v <= 0:
+            raise ValueError("Connection pool limits must be positive")
+        return v
+
     @field_validator("base_url")
     @classmethod
     def validate_base_url(cls, v: str) -> str:
@@ -77,6 +168,15 @@ class Config(BaseModel):
         if self.use_sandbox:
             self.base_url = SANDBOX_URL
 
+    @property
+    def pool_limits(self) -> httpx.Limits:
+        """Connection pool limits for the shared HTTP client."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
     @classmethod
     def from_env(cls, **kwargs: Any) -> "Config":
         """Create config from environment variables.
@@ -6,7 +6,7 @@ when interacting with the Companies House API.
 
 import contextlib
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     import httpx
@@ -15,6 +15,9 @@ if TYPE_CHECKING:
 class CompaniesHouseError(Exception):
     """Base exception for all Companies House API errors."""
 
+    # Slots keep per-instance attributes out of a __dict__ on hot retry paths
+    __slots__ = ("message", "status_code")
+
     def __init__(self, message: str, status_code: int | None = None) -> None:
         """Initialize the exception.
 
@@ -26,10 +29,23 @@ class CompaniesHouseError(Exception):
         self.message = message
         self.status_code = status_code
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Include slot attributes and the instance ``__dict__`` when pickling."""
+        slot_values = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+        # BaseException still has a __dict__ (e.g. __notes__ from add_note)
+        return (type(self), self.args, {**self.__dict__, **slot_values})
+
 
 class AuthenticationError(CompaniesHouseError):
     """Raised when authentication fails (401 status)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication failed") -> None:
         """Initialize authentication error."""
         super().__init__(message, status_code=401)
@@ -38,6 +54,8 @@ class AuthenticationError(CompaniesHouseError):
 class RateLimitError(CompaniesHouseError):
     """Raised when rate limit is exceeded (429 status)."""
 
+    __slots__ = ("retry_after", "rate_limit_remain", "rate_limit_limit", "rate_limit_reset")
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -118,6 +136,8 @@ class RateLimitError(CompaniesHouseError):
 class NotFoundError(CompaniesHouseError):
     """Raised when a resource is not found (404 status)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Resource not found") -> None:
         """Initialize not found error."""
         super().__init__(message, status_code=404)
@@ -126,6 +146,8 @@ class NotFoundError(CompaniesHouseError):
 class ValidationError(CompaniesHouseError):
     """Raised when data validation fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Validation failed") -> None:
         """Initialize validation error."""
         super().__init__(message, status_code=400)
@@ -134,6 +156,8 @@ class ValidationError(CompaniesHouseError):
 class ServerError(CompaniesHouseError):
     """Raised when server returns 5xx status."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Server error", status_code: int = 500) -> None:
         """Initialize server error."""
         super().__init__(message, status_code=status_code)
@@ -142,6 +166,8 @@ class ServerError(CompaniesHouseError):
 class NetworkError(CompaniesHouseError):
     """Raised when network connection fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Network connection failed") -> None:
         """Initialize network error."""
         super().__init__(message, status_code=None)
@@ -0,0 +1,24 @@
+"""Logging helpers for UK Companies API client."""
+
+from typing import Any
+
+
+def is_enabled_for(log: Any, level: int) -> bool:
+    """Check whether a structlog logger would emit events at ``level``.
+
+    Supports both structlog's filtering bound loggers and stdlib-backed
+    loggers; anything else is assumed to be enabled.
+
+    Args:
+        log: structlog logger (or lazy proxy)
+        level: Standard library logging level
+
+    Returns:
+        True if events at ``level`` are emitted
+    """
+    bound = log.bind()
+    for name in ("is_enabled_for", "isEnabledFor"):
+        check = getattr(bound, name, None)
+        if check is not None:
+            return bool(check(level))
+    return True
@@ -1,22 +1,10 @@
 """Models package for UK Companies API client."""
 
+from importlib import import_module
+from typing import Any
+
 from .address import Address
-from .appointment import Appointment, AppointmentList
-from .appointment import CompanyStatus as AppointmentCompanyStatus
 from .base import BaseModel
-from .charge import (
-    Charge,
-    ChargeClassification,
-    ChargeLinks,
-    ChargeList,
-    ChargeParticulars,
-    ChargeStatus,
-    ChargeTransaction,
-    InsolvencyCase,
-    PersonEntitled,
-    SecuredDetails,
-    TransactionLinks,
-)
 from .company import (
     AccountingReference,
     Accounts,
@@ -26,19 +14,6 @@ from .company import (
     ConfirmationStatement,
     Jurisdiction,
 )
-from .disqualification import (
-    Disqualification,
-    DisqualificationItem,
-    DisqualificationList,
-    DisqualificationReason,
-)
-from .officer import (
-    IdentificationType,
-    Officer,
-    OfficerList,
-    OfficerRole,
-    PartialDate,
-)
 from .rate_limit import RateLimitInfo
 from .search import (
     AllSearchResult,
@@ -50,6 +25,54 @@ from .search import (
     SearchResult,
 )
 
+# Less frequently used models are imported on first access (PEP 562) to keep
+# ``import ukcompanies`` fast. Maps exported name -> (submodule, attribute).
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    # Charge
+    "Charge": ("charge", "Charge"),
+    "ChargeList": ("charge", "ChargeList"),
+    "ChargeStatus": ("charge", "ChargeStatus"),
+    "ChargeClassification": ("charge", "ChargeClassification"),
+    "ChargeParticulars": ("charge", "ChargeParticulars"),
+    "SecuredDetails": ("charge", "SecuredDetails"),
+    "PersonEntitled": ("charge", "PersonEntitled"),
+    "ChargeLinks": ("charge", "ChargeLinks"),
+    "ChargeTransaction": ("charge", "ChargeTransaction"),
+    "TransactionLinks": ("charge", "TransactionLinks"),
+    "InsolvencyCase": ("charge", "InsolvencyCase"),
+    # Officer
+    "Officer": ("officer", "Officer"),
+    "OfficerList": ("officer", "OfficerList"),
+    "OfficerRole": ("officer", "OfficerRole"),
+    "IdentificationType": ("officer", "IdentificationType"),
+    "PartialDate": ("officer", "PartialDate"),
+    # Appointment
+    "Appointment": ("appointment", "Appointment"),
+    "AppointmentList": ("appointment", "AppointmentList"),
+    "AppointmentCompanyStatus": ("appointment", "CompanyStatus"),
+    # Disqualification
+    "Disqualification": ("disqualification", "Disqualification"),
+    "DisqualificationItem": ("disqualification", "DisqualificationItem"),
+    "DisqualificationList": ("disqualification", "DisqualificationList"),
+    "DisqualificationReason": ("disqualification", "DisqualificationReason"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported models on first access."""
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(import_module(f".{module_name}", __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported models in dir()."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     # Base
     "BaseModel",
@@ -1,9 +1,9 @@
 """Search result models for UK Companies API."""
 
 from datetime import date
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import Field
+from pydantic import Discriminator, Field, Tag
 
 from .address import Address
 from .base import BaseModel
@@ -57,6 +57,39 @@ class DisqualifiedOfficerSearchItem(BaseModel):
     links: dict[str, str] | None = Field(None, description="Related resource links")
 
 
+_COMPANY_KIND = "searchresults#company"
+_OFFICER_KIND = "searchresults#officer"
+_DISQUALIFIED_OFFICER_KIND = "searchresults#disqualified-officer"
+_SEARCH_ITEM_KINDS = frozenset((_COMPANY_KIND, _OFFICER_KIND, _DISQUALIFIED_OFFICER_KIND))
+
+
+def _search_item_kind(item: Any) -> str:
+    """Pick the search item model for an entry in a combined search.
+
+    Uses the item's ``kind`` so each entry is validated against a single
+    model; items without a recognised kind fall back to company or officer
+    depending on whether they carry a company number.
+    """
+    if isinstance(item, dict):
+        kind = item.get("kind")
+        has_company_number = "company_number" in item
+    else:
+        kind = getattr(item, "kind", None)
+        has_company_number = hasattr(item, "company_number")
+
+    if kind in _SEARCH_ITEM_KINDS:
+        return str(kind)
+    return _COMPANY_KIND if has_company_number else _OFFICER_KIND
+
+
+SearchItem = Annotated[
+    Annotated[CompanySearchItem, Tag(_COMPANY_KIND)]
+    | Annotated[OfficerSearchItem, Tag(_OFFICER_KIND)]
+    | Annotated[DisqualifiedOfficerSearchItem, Tag(_DISQUALIFIED_OFFICER_KIND)],
+    Discriminator(_search_item_kind),
+]
+
+
 class SearchResult(BaseModel):
     """Base search result with pagination."""
 
@@ -102,9 +135,7 @@ class OfficerSearchResult(SearchResult):
 class AllSearchResult(SearchResult):
     """Combined search results for all types."""
 
-    items: list[CompanySearchItem | OfficerSearchItem | DisqualifiedOfficerSearchItem] = Field(
-        default_factory=list, description="All search items"
-    )
+    items: list[SearchItem] = Field(default_factory=list, description="All search items")
     kind: str = Field("search#all", description="Search result type")
 
     def get_companies(self) -> list[CompanySearchItem]:
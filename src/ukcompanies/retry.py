@@ -12,12 +12,16 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Dedicated generator for retry jitter, independent of the global random state
+_BACKOFF_RNG = random.Random()
+
 
 class BackoffStrategy(Enum):
     """Backoff strategy for retry logic."""
 
     EXPONENTIAL = "exponential"
     FIXED = "fixed"
+    DECORRELATED = "decorrelated"
 
 
 class RetryConfig:
@@ -38,7 +42,7 @@ class RetryConfig:
         Args:
             auto_retry: Whether to automatically retry on rate limit
             max_retries: Maximum number of retry attempts
-            backoff: Backoff strategy ("exponential" or "fixed")
+            backoff: Backoff strategy ("exponential", "fixed" or "decorrelated")
             base_delay: Base delay in seconds for backoff calculation
             max_delay: Maximum delay in seconds between retries
             jitter_range: Maximum jitter to add to delay in seconds
@@ -86,7 +90,7 @@ def exponential_backoff(
         Delay in seconds before next retry
     """
     delay: float = min(2**attempt * base_delay, max_delay)
-    jitter = random.uniform(0, jitter_range)
+    jitter = _BACKOFF_RNG.uniform(0, jitter_range)
     return delay + jitter
 
 
@@ -107,10 +111,32 @@ def fixed_backoff(
     Returns:
         Delay in seconds before next retry
     """
-    jitter = random.uniform(0, jitter_range)
+    jitter = _BACKOFF_RNG.uniform(0, jitter_range)
     return base_delay + jitter
 
 
+def decorrelated_backoff(
+    prev_delay: float,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+) -> float:
+    """Calculate backoff with decorrelated jitter.
+
+    Each delay is drawn between ``base_delay`` and three times the previous
+    delay, so clients that were throttled together spread out instead of
+    retrying in step.
+
+    Args:
+        prev_delay: Previous delay in seconds (``base_delay`` initially)
+        base_delay: Minimum delay in seconds
+        max_delay: Maximum delay in seconds
+
+    Returns:
+        Delay in seconds before next retry
+    """
+    return min(_BACKOFF_RNG.uniform(base_delay, prev_delay * 3), max_delay)
+
+
 class RetryManager:
     """Manages retry logic for rate-limited requests."""
 
@@ -122,16 +148,23 @@ class RetryManager:
         """
         self.config = config
 
-    def _get_backoff_delay(self, attempt: int) -> float:
+    def _get_backoff_delay(self, attempt: int, prev_delay: float | None = None) -> float:
         """Get backoff delay for given attempt.
 
         Args:
             attempt: Retry attempt number (0-based)
+            prev_delay: Previous delay in seconds, used by decorrelated backoff
 
         Returns:
             Delay in seconds
         """
-        if self.config.backoff_strategy == BackoffStrategy.EXPONENTIAL:
+        if self.config.backoff_strategy == BackoffStrategy.DECORRELATED:
+            return decorrelated_backoff(
+                prev_delay if prev_delay is not None else self.config.base_delay,
+                self.config.base_delay,
+                self.config.max_delay,
+            )
+        elif self.config.backoff_strategy == BackoffStrategy.EXPONENTIAL:
             return exponential_backoff(
                 attempt,
                 self.config.base_delay,
@@ -218,6 +251,7 @@ class RetryManager:
         from .exceptions import NetworkError, RateLimitError
 
         attempt = 0
+        prev_delay = self.config.base_delay
 
         while attempt <= self.config.max_retries:
             try:
@@ -235,7 +269,8 @@ class RetryManager:
                 if e.retry_after is not None:
                     wait_time = min(e.retry_after, self.config.max_delay)
                 else:
-                    wait_time = self._get_backoff_delay(attempt)
+                    wait_time = self._get_backoff_delay(attempt, prev_delay)
+                prev_delay = wait_time
 
                 # Call retry callback if provided
                 if self.config.on_retry:
@@ -272,7 +307,8 @@ class RetryManager:
                     error=str(exc),
                     attempt=attempt + 1,
                 )
-                wait_time = self._get_backoff_delay(attempt)
+                wait_time = self._get_backoff_delay(attempt, prev_delay)
+                prev_delay = wait_time
                 await asyncio.sleep(wait_time)
                 attempt += 1
 
@@ -1,5 +1,6 @@
 """Integration tests for company endpoints."""
 
+import asyncio
 from datetime import date
 
 import httpx
@@ -122,6 +123,129 @@ class TestGetCompany:
         assert company.company_number == "12345678"
         assert company.company_name == "TEST COMPANY"
 
+    @respx.mock
+    async def test_get_company_cached(self):
+        """Test repeated lookups are served from the cache."""
+        mock_response = {
+            "company_number": "12345678",
+            "company_name": "TEST COMPANY",
+        }
+
+        route = respx.get("https://api.company-information.service.gov.uk/company/12345678").mock(
+            return_value=httpx.Response(200, json=mock_response)
+        )
+
+        async with AsyncClient(api_key="test-key") as client:
+            first = await client.get_company("12345678")
+            second = await client.get_company("1234 5678")
+            assert second == first
+            assert route.call_count == 1
+
+            # Callers get their own copies, so mutations do not leak into the cache
+            second.company_name = "CHANGED"
+            third = await client.get_company("12345678")
+            assert third.company_name == "TEST COMPANY"
+            assert route.call_count == 1
+
+            client.clear_cache()
+            await client.get_company("12345678")
+            assert route.call_count == 2
+
+    @respx.mock
+    async def test_get_company_cache_disabled(self):
+        """Test a zero cache TTL always hits the API."""
+        mock_response = {
+            "company_number": "12345678",
+            "company_name": "TEST COMPANY",
+        }
+
+        route = respx.get("https://api.company-information.service.gov.uk/company/12345678").mock(
+            return_value=httpx.Response(200, json=mock_response)
+        )
+
+        async with AsyncClient(api_key="test-key", cache_ttl=0) as client:
+            await client.get_company("12345678")
+            await client.get_company("12345678")
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_get_company_concurrent_lookups_coalesced(self):
+        """Test concurrent lookups of the same company share one request."""
+        mock_response = {
+            "company_number": "12345678",
+            "company_name": "TEST COMPANY",
+        }
+
+        async def respond(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=mock_response)
+
+        route = respx.get("https://api.company-information.service.gov.uk/company/12345678").mock(
+            side_effect=respond
+        )
+
+        async with AsyncClient(api_key="test-key", cache_ttl=0) as client:
+            results = await asyncio.gather(*(client.get_company("12345678") for _ in range(5)))
+            assert client._in_flight == {}
+
+        assert route.call_count == 1
+        assert all(result == results[0] for result in results)
+        assert len({id(result) for result in results}) == len(results)
+
+    @respx.mock
+    async def test_get_company_cancelled_caller_does_not_cancel_others(self):
+        """Test cancelling the first caller leaves other coalesced callers running."""
+        mock_response = {
+            "company_number": "12345678",
+            "company_name": "TEST COMPANY",
+        }
+
+        async def respond(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=mock_response)
+
+        route = respx.get("https://api.company-information.service.gov.uk/company/12345678").mock(
+            side_effect=respond
+        )
+
+        async with AsyncClient(api_key="test-key") as client:
+            leader = asyncio.create_task(client.get_company("12345678"))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(client.get_company("12345678"))
+            await asyncio.sleep(0.01)
+
+            leader.cancel()
+            company = await follower
+
+            assert leader.cancelled()
+            assert isinstance(company, Company)
+            assert company.company_number == "12345678"
+            assert client._in_flight == {}
+
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_get_company_concurrent_lookups_share_error(self):
+        """Test a failed coalesced lookup raises for every caller."""
+
+        async def respond(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(404, json={"error": "Company not found"})
+
+        route = respx.get("https://api.company-information.service.gov.uk/company/99999999").mock(
+            side_effect=respond
+        )
+
+        async with AsyncClient(api_key="test-key") as client:
+            results = await asyncio.gather(
+                *(client.get_company("99999999") for _ in range(3)), return_exceptions=True
+            )
+            assert client._in_flight == {}
+
+        assert route.call_count == 1
+        assert all(isinstance(result, NotFoundError) for result in results)
+
 
 @pytest.mark.asyncio
 class TestGetCompanyAddress:
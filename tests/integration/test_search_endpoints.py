@@ -1,12 +1,21 @@
 """Integration tests for search endpoints."""
 
+import asyncio
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 import respx
 
 from ukcompanies import AsyncClient
-from ukcompanies.models.search import CompanySearchResult, OfficerSearchResult
+from ukcompanies.exceptions import NotFoundError
+from ukcompanies.models.search import (
+    CompanySearchItem,
+    CompanySearchResult,
+    DisqualifiedOfficerSearchItem,
+    OfficerSearchItem,
+    OfficerSearchResult,
+)
 
 
 @pytest.mark.asyncio
@@ -246,3 +255,171 @@ class TestSearchAll:
 
         # Should stop after 2 pages even though more are available
         assert len(pages) == 2
+
+    @respx.mock
+    async def test_search_all_pages_pagination_delay(self):
+        """Test search_all_pages only sleeps between pages when configured."""
+        mock_response = {
+            "items": [{"title": "Item"}],
+            "items_per_page": 1,
+            "kind": "search#all",
+            "page_number": 1,
+            "start_index": 0,
+            "total_results": 10,
+        }
+
+        respx.get("https://api.company-information.service.gov.uk/search").mock(
+            return_value=httpx.Response(200, json=mock_response)
+        )
+
+        with patch("ukcompanies.client_endpoints.asyncio.sleep", new=AsyncMock()) as sleep:
+            async with AsyncClient(api_key="test-key") as client:
+                async for _ in client.search_all_pages("test", per_page=1, max_pages=3):
+                    pass
+            assert sleep.call_count == 0
+
+            async with AsyncClient(api_key="test-key", pagination_delay=0.5) as client:
+                async for _ in client.search_all_pages("test", per_page=1, max_pages=3):
+                    pass
+            sleep.assert_awaited_with(0.5)
+
+    @respx.mock
+    async def test_search_all_pages_concurrent_in_order(self):
+        """Test remaining pages are fetched concurrently but yielded in order."""
+        concurrent_count = 0
+        max_concurrent = 0
+
+        async def page_response(request):
+            nonlocal concurrent_count, max_concurrent
+            start_index = int(request.url.params["start_index"])
+            concurrent_count += 1
+            max_concurrent = max(max_concurrent, concurrent_count)
+            # Later pages respond faster to exercise ordering
+            await asyncio.sleep(0.01 * (6 - start_index))
+            concurrent_count -= 1
+            return httpx.Response(
+                200,
+                json={
+                    "items": [{"title": f"Item {start_index}"}],
+                    "items_per_page": 1,
+                    "kind": "search#all",
+                    "start_index": start_index,
+                    "total_results": 6,
+                },
+            )
+
+        route = respx.get("https://api.company-information.service.gov.uk/search")
+        route.side_effect = page_response
+
+        async with AsyncClient(api_key="test-key", max_concurrency=2) as client:
+            pages = [page async for page in client.search_all_pages("test", per_page=1)]
+
+        assert [page.start_index for page in pages] == [0, 1, 2, 3, 4, 5]
+        assert route.call_count == 6
+        assert max_concurrent == 2
+
+    @respx.mock
+    async def test_search_all_pages_bounded_prefetch(self):
+        """Test pages are only prefetched up to max_concurrency ahead of the caller."""
+        mock_response = {
+            "items": [{"title": "Item"}],
+            "items_per_page": 100,
+            "kind": "search#all",
+            "start_index": 0,
+            "total_results": 200000,
+        }
+
+        route = respx.get("https://api.company-information.service.gov.uk/search").mock(
+            return_value=httpx.Response(200, json=mock_response)
+        )
+
+        async with AsyncClient(api_key="test-key", max_concurrency=2) as client:
+            pages = client.search_all_pages("test", per_page=100)
+            await anext(pages)
+            await anext(pages)
+
+            # Caller pauses; let any scheduled requests finish
+            await asyncio.sleep(0.05)
+            # First page, the page just yielded and two prefetched pages
+            assert route.call_count == 4
+
+            await pages.aclose()
+
+
+@pytest.mark.asyncio
+class TestSearchAllItems:
+    """Test search_all_items streaming generator."""
+
+    @pytest.fixture(autouse=True)
+    def require_ijson(self):
+        """Skip when the optional ijson dependency is missing."""
+        pytest.importorskip("ijson")
+
+    @respx.mock
+    async def test_search_all_items_streams_all_pages(self):
+        """Test items from every page are yielded with the right model."""
+        page_1 = {
+            "items": [
+                {"kind": "searchresults#company", "company_number": "12345678", "title": "Co"},
+                {"kind": "searchresults#officer", "title": "John Smith"},
+            ],
+            "total_results": 3,
+        }
+        page_2 = {
+            "items": [{"kind": "searchresults#disqualified-officer", "title": "Jane Doe"}],
+            "total_results": 3,
+        }
+
+        route = respx.get("https://api.company-information.service.gov.uk/search")
+        route.side_effect = [
+            httpx.Response(200, json=page_1),
+            httpx.Response(200, json=page_2),
+        ]
+
+        async with AsyncClient(api_key="test-key") as client:
+            items = [item async for item in client.search_all_items("test", per_page=2)]
+
+        assert [type(item) for item in items] == [
+            CompanySearchItem,
+            OfficerSearchItem,
+            DisqualifiedOfficerSearchItem,
+        ]
+        assert route.call_count == 2
+        assert route.calls[1].request.url.params["start_index"] == "2"
+
+    @respx.mock
+    async def test_search_all_items_max_items(self):
+        """Test iteration stops once max_items have been yielded."""
+        page = {"items": [{"title": f"Officer {i}"} for i in range(5)]}
+
+        route = respx.get("https://api.company-information.service.gov.uk/search").mock(
+            return_value=httpx.Response(200, json=page)
+        )
+
+        async with AsyncClient(api_key="test-key") as client:
+            items = [
+                item async for item in client.search_all_items("test", per_page=5, max_items=3)
+            ]
+
+        assert len(items) == 3
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_search_all_items_error_response(self):
+        """Test error responses raise the usual exceptions."""
+        respx.get("https://api.company-information.service.gov.uk/search").mock(
+            return_value=httpx.Response(404, json={"error": "Not found"})
+        )
+
+        async with AsyncClient(api_key="test-key") as client:
+            with pytest.raises(NotFoundError):
+                async for _ in client.search_all_items("test"):
+                    pass
+
+    async def test_search_all_items_requires_ijson(self):
+        """Test a helpful ImportError is raised without ijson."""
+        with patch.dict("sys.modules", {"ijson": None}):
+            async with AsyncClient(api_key="test-key") as client:
+                with pytest.raises(ImportError, match="ukcompanies\\[streaming\\]"):
+                    async for _ in client.search_all_items("test"):
+                        pass
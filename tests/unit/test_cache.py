@@ -0,0 +1,58 @@
+"""Unit tests for the response cache."""
+
+from unittest.mock import patch
+
+from ukcompanies.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache class."""
+
+    def test_set_and_get(self):
+        """Test storing and retrieving a value."""
+        cache: TTLCache[str] = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", "value")
+
+        assert cache.get("a") == "value"
+        assert cache.get("missing") is None
+
+    def test_expired_entry_is_removed(self):
+        """Test entries are dropped once their TTL has passed."""
+        cache: TTLCache[str] = TTLCache(maxsize=10, ttl=60)
+
+        with patch("ukcompanies.cache.time.monotonic", return_value=100.0):
+            cache.set("a", "value")
+        with patch("ukcompanies.cache.time.monotonic", return_value=159.0):
+            assert cache.get("a") == "value"
+        with patch("ukcompanies.cache.time.monotonic", return_value=160.0):
+            assert cache.get("a") is None
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_disabled_cache(self):
+        """Test a zero size or TTL disables caching."""
+        for cache in (TTLCache(maxsize=0, ttl=60), TTLCache(maxsize=10, ttl=0)):
+            assert cache.enabled is False
+            cache.set("a", 1)
+            assert cache.get("a") is None
+
+    def test_clear(self):
+        """Test clearing the cache."""
+        cache: TTLCache[int] = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get("a") is None
@@ -1,11 +1,14 @@
 """Unit tests for AsyncClient."""
 
+import asyncio
+import logging
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 import respx
+import structlog
 
 from ukcompanies.client import AsyncClient
 from ukcompanies.config import Config
@@ -17,6 +20,7 @@ from ukcompanies.exceptions import (
     ServerError,
     ValidationError,
 )
+from ukcompanies.retry import BackoffStrategy
 
 
 @pytest.mark.asyncio
@@ -52,6 +56,17 @@ class TestAsyncClient:
         assert client.config.timeout == 60.0
         assert client.config.use_sandbox is True
 
+    async def test_init_retry_uses_config_base_delay(self):
+        """Test Config.base_delay and decorrelated backoff drive client retries."""
+        client = AsyncClient(api_key="test-api-key-12345678901234567890", base_delay=0.2)
+        assert client.retry_config.base_delay == 0.2
+        assert client.retry_config.backoff_strategy == BackoffStrategy.DECORRELATED
+
+    async def test_init_max_backoff_caps_retry_delay(self):
+        """Test Config.max_backoff bounds the retry manager's waits."""
+        client = AsyncClient(api_key="test-api-key-12345678901234567890", max_backoff=5.0)
+        assert client.retry_config.max_delay == 5.0
+
     @patch.dict("os.environ", {"COMPANIES_HOUSE_API_KEY": "env-key-12345678901234567890"})
     async def test_init_from_environment(self):
         """Test client initialization from environment."""
@@ -74,6 +89,33 @@ class TestAsyncClient:
         # Note: We can't directly check if closed, but we can verify it was set
         assert client._client is not None
 
+    async def test_http2_enabled_when_available(self):
+        """Test HTTP/2 is requested only when enabled and h2 is installed."""
+        for available, enabled, expected in [
+            (True, True, True),
+            (True, False, False),
+            (False, True, False),
+        ]:
+            client = AsyncClient(api_key="test-key", http2=enabled)
+            with patch("ukcompanies.client.HTTP2_AVAILABLE", available), \
+                    patch("ukcompanies.client.httpx.AsyncClient") as http_client:
+                http_client.return_value.aclose = AsyncMock()
+                async with client:
+                    pass
+
+            assert http_client.call_args.kwargs["http2"] is expected
+
+    async def test_debug_logging_disabled_by_structlog_level(self):
+        """Test per-request debug logging is skipped when filtered out."""
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+        try:
+            client = AsyncClient(api_key="test-key")
+        finally:
+            structlog.reset_defaults()
+
+        assert client._debug_enabled is False
+        assert AsyncClient(api_key="test-key")._debug_enabled is True
+
     async def test_validate_company_number_valid(self):
         """Test company number validation with valid numbers."""
         client = AsyncClient(api_key="test-key")
@@ -296,6 +338,44 @@ class TestAsyncClient:
             await client._request("GET", "/test")
         assert "not initialized" in str(exc_info.value)
 
+    async def test_pause_for_rate_limit_releases_after_wait(self):
+        """Test a rate limit pause blocks until its timer fires."""
+        client = AsyncClient(api_key="test-key")
+        client._pause_for_rate_limit(0.05)
+        assert not client._rate_limit_ready.is_set()
+
+        await asyncio.wait_for(client._rate_limit_ready.wait(), timeout=1)
+        assert client._rate_limit_resume is None
+
+    async def test_pause_for_rate_limit_never_shortened(self):
+        """Test a shorter pause does not cut an existing longer pause short."""
+        client = AsyncClient(api_key="test-key")
+        client._pause_for_rate_limit(10)
+        handle = client._rate_limit_resume
+
+        client._pause_for_rate_limit(0.01)
+        assert client._rate_limit_resume is handle
+
+        async with client:
+            pass
+        assert client._rate_limit_ready.is_set()
+
+    @respx.mock
+    async def test_request_waits_for_rate_limit_pause(self):
+        """Test requests issued during a pause are held until it ends."""
+        route = respx.get("https://api.company-information.service.gov.uk/test").mock(
+            return_value=httpx.Response(200, json={})
+        )
+
+        async with AsyncClient(api_key="test-key") as client:
+            client._pause_for_rate_limit(0.05)
+            task = asyncio.create_task(client.get("/test"))
+            await asyncio.sleep(0.01)
+            assert not route.called
+
+            await task
+            assert route.call_count == 1
+
     @respx.mock
     async def test_get_method(self):
         """Test GET method."""
@@ -318,6 +398,17 @@ class TestAsyncClient:
             result = await client.get("/test", params={"q": "search"})
             assert result == {"results": []}
 
+    @respx.mock
+    async def test_get_content_returns_raw_body(self):
+        """Test _get_content returns the undecoded response body."""
+        respx.get("https://api.company-information.service.gov.uk/test").mock(
+            return_value=httpx.Response(200, content=b'{"data": "test"}')
+        )
+
+        async with AsyncClient(api_key="test-key") as client:
+            result = await client._get_content("/test")
+            assert result == b'{"data": "test"}'
+
     @respx.mock
     async def test_post_method(self):
         """Test POST method."""
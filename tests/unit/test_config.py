@@ -7,7 +7,9 @@ import pytest
 from pydantic import ValidationError as PydanticValidationError
 
 from ukcompanies.config import (
+    BASE_DELAY,
     BASE_URL,
+    DEFAULT_MAX_BACKOFF,
     DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT,
     SANDBOX_URL,
@@ -94,6 +96,69 @@ class TestConfig:
             Config(api_key="test-key", max_retries=11)
         assert "Max retries cannot exceed 10" in str(exc_info.value)
 
+    def test_base_delay_validation(self):
+        """Test base delay validation."""
+        config = Config(api_key="test-key")
+        assert config.base_delay == BASE_DELAY
+
+        with pytest.raises(PydanticValidationError) as exc_info:
+            Config(api_key="test-key", base_delay=0)
+        assert "Base delay must be positive" in str(exc_info.value)
+
+    def test_max_backoff_validation(self):
+        """Test max backoff validation."""
+        config = Config(api_key="test-key")
+        assert config.max_backoff == DEFAULT_MAX_BACKOFF
+
+        with pytest.raises(PydanticValidationError) as exc_info:
+            Config(api_key="test-key", max_backoff=0)
+        assert "Max backoff must be positive" in str(exc_info.value)
+
+    def test_pagination_delay_validation(self):
+        """Test pagination delay validation."""
+        config = Config(api_key="test-key")
+        assert config.pagination_delay == 0.0
+
+        with pytest.raises(PydanticValidationError) as exc_info:
+            Config(api_key="test-key", pagination_delay=-1)
+        assert "Pagination delay cannot be negative" in str(exc_info.value)
+
+    def test_max_concurrency_validation(self):
+        """Test max concurrency validation."""
+        config = Config(api_key="test-key")
+        assert config.max_concurrency == 5
+
+        with pytest.raises(PydanticValidationError) as exc_info:
+            Config(api_key="test-key", max_concurrency=0)
+        assert "Max concurrency must be at least 1" in str(exc_info.value)
+
+    def test_cache_settings_validation(self):
+        """Test cache settings validation."""
+        config = Config(api_key="test-key", cache_ttl=0, cache_size=0)
+        assert config.cache_ttl == 0
+        assert config.cache_size == 0
+
+        with pytest.raises(PydanticValidationError) as exc_info:
+            Config(api_key="test-key", cache_ttl=-1)
+        assert "Cache settings cannot be negative" in str(exc_info.value)
+
+    def test_pool_limits(self):
+        """Test connection pool limits are built from config."""
+        config = Config(
+            api_key="test-key",
+            max_connections=20,
+            max_keepalive_connections=10,
+            keepalive_expiry=5.0,
+        )
+        limits = config.pool_limits
+        assert limits.max_connections == 20
+        assert limits.max_keepalive_connections == 10
+        assert limits.keepalive_expiry == 5.0
+
+        with pytest.raises(PydanticValidationError) as exc_info:
+            Config(api_key="test-key", max_connections=0)
+        assert "Connection pool limits must be positive" in str(exc_info.value)
+
     def test_base_url_trailing_slash_removal(self):
         """Test that trailing slashes are removed from base URL."""
         config = Config(
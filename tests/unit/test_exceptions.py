@@ -1,5 +1,6 @@
 """Unit tests for exceptions module."""
 
+import pickle
 
 from ukcompanies.exceptions import (
     AuthenticationError,
@@ -28,6 +29,34 @@ class TestCompaniesHouseError:
         assert error.message == "Test error"
         assert error.status_code == 500
 
+    def test_attributes_stored_in_slots(self):
+        """Test exception attributes live in slots rather than __dict__."""
+        error = RateLimitError(retry_after=5.0)
+        assert "status_code" not in vars(error)
+        assert "retry_after" not in vars(error)
+
+    def test_pickle_round_trip(self):
+        """Test slot attributes survive pickling."""
+        error = pickle.loads(pickle.dumps(ServerError("Bad gateway", status_code=502)))
+        assert error.message == "Bad gateway"
+        assert error.status_code == 502
+
+        error = pickle.loads(pickle.dumps(RateLimitError(retry_after=5.0, rate_limit_limit=600)))
+        assert error.retry_after == 5.0
+        assert error.rate_limit_limit == 600
+        assert str(error) == "Rate limit exceeded (retry after 5.0 seconds)"
+
+    def test_pickle_round_trip_keeps_notes_and_attributes(self):
+        """Test notes and ad-hoc attributes survive pickling."""
+        error = ServerError("Bad gateway", status_code=502)
+        error.add_note("while fetching company 12345678")
+        error.request_id = "abc123"
+
+        restored = pickle.loads(pickle.dumps(error))
+        assert restored.__notes__ == ["while fetching company 12345678"]
+        assert restored.request_id == "abc123"
+        assert restored.status_code == 502
+
 
 class TestAuthenticationError:
     """Test authentication error."""
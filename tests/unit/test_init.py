@@ -1,6 +1,8 @@
 """Unit tests for package initialization."""
 
 import re
+import subprocess
+import sys
 
 
 def test_version_import() -> None:
@@ -17,3 +19,27 @@ def test_package_imports() -> None:
 
     assert hasattr(ukcompanies, "__version__")
     assert re.match(r"^\d+\.\d+\.\d+", ukcompanies.__version__)
+
+
+def test_public_exports_resolve() -> None:
+    """Test that every name listed in __all__ can be imported."""
+    import ukcompanies
+    import ukcompanies.models
+
+    for module in (ukcompanies, ukcompanies.models):
+        for name in module.__all__:
+            assert hasattr(module, name), f"{module.__name__}.{name}"
+
+
+def test_import_defers_uncommon_models() -> None:
+    """Test that importing the package does not load lazily imported models."""
+    code = (
+        "import sys, ukcompanies; "
+        "print(sorted(m for m in sys.modules if m.startswith('ukcompanies.models.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    for module in ("appointment", "charge", "disqualification", "document", "filing", "officer"):
+        assert f"ukcompanies.models.{module}'" not in result.stdout
@@ -0,0 +1,30 @@
+"""Unit tests for logging helpers."""
+
+import logging
+
+import structlog
+
+from ukcompanies.logging_utils import is_enabled_for
+
+
+class TestIsEnabledFor:
+    """Test is_enabled_for helper."""
+
+    def test_filtering_bound_logger(self):
+        """Test levels below the configured structlog level are disabled."""
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+        try:
+            log = structlog.get_logger("test")
+            assert is_enabled_for(log, logging.DEBUG) is False
+            assert is_enabled_for(log, logging.INFO) is True
+        finally:
+            structlog.reset_defaults()
+
+    def test_unknown_logger_assumed_enabled(self):
+        """Test loggers without a level check are treated as enabled."""
+
+        class PlainLogger:
+            def bind(self):
+                return self
+
+        assert is_enabled_for(PlainLogger(), logging.DEBUG) is True
@@ -2,16 +2,20 @@
 
 import asyncio
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from ukcompanies.exceptions import RateLimitError
+from ukcompanies.client_endpoints import RetryMixin
+from ukcompanies.config import Config
+from ukcompanies.exceptions import RateLimitError, ServerError
 from ukcompanies.retry import (
+    _BACKOFF_RNG,
     BackoffStrategy,
     RetryConfig,
     RetryManager,
+    decorrelated_backoff,
     exponential_backoff,
     fixed_backoff,
 )
@@ -130,6 +134,16 @@ class TestBackoffFunctions:
         # 5 plus 0-2 seconds of jitter
         assert 5.0 <= delay <= 7.0
 
+    def test_decorrelated_backoff_range(self):
+        """Test decorrelated backoff is drawn between base and three times previous."""
+        for _ in range(50):
+            delay = decorrelated_backoff(4.0, base_delay=1.0, max_delay=60.0)
+            assert 1.0 <= delay <= 12.0
+
+    def test_decorrelated_backoff_respects_max_delay(self):
+        """Test decorrelated backoff is capped at max_delay."""
+        assert decorrelated_backoff(100.0, base_delay=10.0, max_delay=5.0) == 5.0
+
 
 class TestRetryManager:
     """Test RetryManager class."""
@@ -163,6 +177,13 @@ class TestRetryManager:
         assert manager._get_backoff_delay(1) == 3.0
         assert manager._get_backoff_delay(2) == 3.0
 
+    def test_get_backoff_delay_decorrelated(self, manager):
+        """Test decorrelated backoff grows from the previous delay."""
+        manager.config.backoff_strategy = BackoffStrategy.DECORRELATED
+
+        assert 1.0 <= manager._get_backoff_delay(0) <= 3.0
+        assert 1.0 <= manager._get_backoff_delay(1, prev_delay=10.0) <= 30.0
+
     def test_extract_reset_time_valid_header(self, manager):
         """Test extracting reset time from valid header."""
         # Create a timestamp 10 seconds in the future
@@ -358,3 +379,79 @@ class TestRetryManager:
             await manager.execute_with_retry(request_func)
 
         assert request_func.call_count == 2  # Initial + 1 retry
+
+
+class _RetryClient(RetryMixin):
+    """Minimal client combining RetryMixin with a mocked transport."""
+
+    def __init__(self, request_func, max_retries=3):
+        self.config = Config(api_key="test-key", max_retries=max_retries)
+        self._request_without_retry = request_func
+
+
+class TestRetryMixin:
+    """Test RetryMixin request retry loop."""
+
+    def test_compute_backoff_uses_retry_after(self):
+        """Test server-provided retry_after is used as the wait time."""
+        client = _RetryClient(AsyncMock())
+        assert client._compute_backoff(1.0, RateLimitError(retry_after=5.0)) == 5.0
+
+    def test_compute_backoff_decorrelated_jitter(self):
+        """Test backoff is drawn between base_delay and three times the previous wait."""
+        client = _RetryClient(AsyncMock())
+        client.config.base_delay = 1.0
+
+        for _ in range(50):
+            wait_time = client._compute_backoff(4.0, ServerError())
+            assert 1.0 <= wait_time <= 12.0
+
+    def test_compute_backoff_uses_dedicated_rng(self):
+        """Test jitter comes from the module's own seedable generator."""
+        client = _RetryClient(AsyncMock())
+
+        _BACKOFF_RNG.seed(42)
+        first = client._compute_backoff(4.0, ServerError())
+        _BACKOFF_RNG.seed(42)
+        assert client._compute_backoff(4.0, ServerError()) == first
+
+    def test_compute_backoff_is_capped(self):
+        """Test backoff never exceeds config.max_backoff."""
+        client = _RetryClient(AsyncMock())
+        client.config.base_delay = 10.0
+        client.config.max_backoff = 5.0
+
+        assert client._compute_backoff(10.0, ServerError()) == 5.0
+        assert client._compute_backoff(10.0, RateLimitError()) == 5.0
+        assert client._compute_backoff(10.0, RateLimitError(retry_after=60.0)) == 5.0
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        """Test rate limit and server errors are retried until success."""
+        request_func = AsyncMock(side_effect=[
+            RateLimitError("Rate limited"),
+            ServerError("Bad gateway", status_code=502),
+            MagicMock(status_code=200),
+        ])
+        client = _RetryClient(request_func)
+        on_retry = MagicMock()
+
+        with patch("ukcompanies.client_endpoints.asyncio.sleep", new=AsyncMock()) as sleep:
+            response = await client._request_with_retry("GET", "/test", on_retry=on_retry)
+
+        assert response.status_code == 200
+        assert request_func.call_count == 3
+        assert sleep.call_count == 2
+        assert [c.args[0] for c in on_retry.call_args_list] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_max_retries_exceeded(self):
+        """Test the last error is raised once max retries is reached."""
+        request_func = AsyncMock(side_effect=ServerError("Server error"))
+        client = _RetryClient(request_func, max_retries=2)
+
+        with patch("ukcompanies.client_endpoints.asyncio.sleep", new=AsyncMock()), \
+                pytest.raises(ServerError):
+            await client._request_with_retry("GET", "/test")
+
+        assert request_func.call_count == 3  # Initial + 2 retries
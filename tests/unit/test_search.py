@@ -315,6 +315,29 @@ class TestAllSearchResult:
         assert len(result.items) == 3
         assert result.kind == "search#all"
 
+    def test_items_parsed_by_kind(self):
+        """Test response items are parsed into the model matching their kind."""
+        result = AllSearchResult.model_validate_json(
+            """{
+                "items": [
+                    {"kind": "searchresults#company", "company_number": "12345678", "title": "Co"},
+                    {"kind": "searchresults#officer", "title": "John Smith"},
+                    {"kind": "searchresults#disqualified-officer", "title": "Jane Doe"},
+                    {"company_number": "87654321", "title": "No Kind Co"},
+                    {"title": "No Kind Officer"}
+                ]
+            }"""
+        )
+
+        assert [type(item) for item in result.items] == [
+            CompanySearchItem,
+            OfficerSearchItem,
+            DisqualifiedOfficerSearchItem,
+            CompanySearchItem,
+            OfficerSearchItem,
+        ]
+        assert len(result.get_disqualified_officers()) == 1
+
     def test_get_companies_method(self):
         """Test get_companies method."""
         company1 = CompanySearchItem(company_number="12345678", title="Company One")